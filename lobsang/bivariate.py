@@ -8,17 +8,24 @@ This module contains methods analyze the bivariate relationship between features
 # Author: Henrique Magalhães Soares
 # Licence: MIT
 
+from __future__ import annotations
+
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-from matplotlib import gridspec
-from typing import Tuple, List
+from typing import Tuple, List, TYPE_CHECKING
 from .numpy_helpers import groupby
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.axes import Axes
+
 
 def bivariate_nom_int(arr_nom: np.array, arr_int: np.array) -> Tuple[plt.Figure, Axes]:
-    keys, values = _groupby(arr_nom, arr_int, np.mean)
-    keys = np.array([str(v) for v in keys])
+    keys, values = groupby(arr_nom, arr_int, np.mean)
+    keys = keys if keys.dtype.kind == "U" else keys.astype(str)
+
+    # matplotlib is imported here so that importing this module does not pay its start up cost.
+    import matplotlib.pyplot as plt
+    from matplotlib import gridspec
 
     fig = plt.figure()
     gs = gridspec.GridSpec(1, 1, figure=fig)
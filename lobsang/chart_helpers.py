@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 import numpy as np
-from matplotlib.axes import Axes
-from typing import List, Tuple, AnyStr
+from typing import List, Tuple, AnyStr, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 
 def label_barh(ax: Axes, labels: List[AnyStr]):
@@ -18,10 +22,10 @@ def label_barh(ax: Axes, labels: List[AnyStr]):
     for bar, label in zip(bars, labels):
         x = bar.get_width()
         y = bar.get_y() + bar.get_height() / 2
-        ax.annotate(label, xy=(x, y), ha="left", va="center", clip_on=True)
-        # We increase the axis by 3% to fit the labels.
-        x_min, x_max = ax.get_xlim()
-        ax.set_xlim(x_min, 1.03*x_max)
+        ax.text(x, y, label, ha="left", va="center", clip_on=True)
+    # We increase the axis by 3% to fit the labels.
+    x_min, x_max = ax.get_xlim()
+    ax.set_xlim(x_min, 1.03*x_max)
 
 
 def label_bar(ax: Axes, labels: List[AnyStr]):
@@ -39,10 +43,10 @@ def label_bar(ax: Axes, labels: List[AnyStr]):
     for bar, label in zip(bars, labels):
         x = bar.get_x() + bar.get_width()/2
         y = bar.get_height()
-        ax.annotate(label, xy=(x, y), ha="center", va="bottom", clip_on=True)
-        # We increase the axis by 3% to fit the labels.
-        y_min, y_max = ax.get_ylim()
-        ax.set_ylim(y_min, 1.03*y_max)
+        ax.text(x, y, label, ha="center", va="bottom", clip_on=True)
+    # We increase the axis by 3% to fit the labels.
+    y_min, y_max = ax.get_ylim()
+    ax.set_ylim(y_min, 1.03*y_max)
 
 
 def make_percentage_labels(values: List[float], decimals: int = 1):
@@ -60,7 +64,9 @@ def make_percentage_labels(values: List[float], decimals: int = 1):
     ----------
     labels: List containing strings with the percentages
     """
-    values = np.array(values)
+    values = np.asarray(values)
     values = values / values.sum()
-    labels = ["{value:.{decimals}%}".format(value=value, decimals=decimals) for value in values]
+    # The format string is built once instead of being parsed again for each value.
+    fmt = "{{:.{decimals}%}}".format(decimals=decimals).format
+    labels = list(map(fmt, values))
     return labels
@@ -12,6 +12,7 @@ methods:
 import numpy as np
 
 from typing import Union, AnyStr
+from .numpy_helpers import unique_count_at_least
 
 MEASUREMENT_LEVELS = ["nominal", "interval"]
 
@@ -49,7 +50,8 @@ def infer_measurement_level(arr: np.array, method: AnyStr = "count_unique", **kw
         return _infer_measurement_by_count(arr, **kwargs)
 
 
-def _infer_measurement_by_count(arr: np.array, threshold: int = 10, use_first: Union[None, int] = None) -> str:
+def _infer_measurement_by_count(arr: np.array, threshold: int = 10, use_first: Union[None, int] = None,
+                                sample: AnyStr = "first", seed: Union[None, int] = None) -> str:
     """"Infers the measurement scale of a feature by using the count method
 
     This method uses the fact that interval measurement level variables usually are real valued features
@@ -63,11 +65,17 @@ def _infer_measurement_by_count(arr: np.array, threshold: int = 10, use_first: U
     This function counts the number of unique values in a numpy array, and classifies it as interval if
     this number is above a threshold.
 
+    When use_first is set, only that many elements are inspected. By default these are the first elements of the
+    array, which may be a biased sample if the data is sorted or generated in blocks. Use sample="random" to
+    inspect a uniformly drawn sample of the same size instead.
+
     Parameters
     ----------
     arr: Numpy array containing the data
     threshold: Threshold of unique values for the classification. Default: 10
     use_first: Number of elements on the array to be used when counting unique values. Default: None (Use all values)
+    sample: How the use_first elements are chosen, either "first" or "random". Default: first
+    seed: Seed for the random number generator when sample is "random". Default: None
 
     Returns
     ----------
@@ -75,10 +83,14 @@ def _infer_measurement_by_count(arr: np.array, threshold: int = 10, use_first: U
 
 
     """
+    assert sample in ["first", "random"], "Invalid sampling method"
     if use_first:
-        arr = arr[0:use_first]
-    unique_count = len(np.unique(arr))
-    if unique_count >= threshold:
+        if sample == "first":
+            arr = arr[0:use_first]
+        elif sample == "random":
+            rng = np.random.default_rng(seed)
+            arr = rng.choice(arr, size=min(use_first, len(arr)), replace=False, shuffle=False)
+    if unique_count_at_least(arr, threshold):
         return "interval"
     else:
         return "nominal"
@@ -1,8 +1,257 @@
 import numpy as np
 
+# Numba is an optional accelerator for groupby. It is only imported, and its kernels compiled, when a caller asks
+# for it with use_numba=True, since the import and compilation cost far more than they save on typical inputs.
+_numba_kernels = None
 
-def groupby(keys, values, agg):
-    aggregated = {key: agg(values[keys == key]) for key in np.unique(keys)}
-    keys = np.array(list(aggregated.keys()))
-    values = np.array(list(aggregated.values()))
-    return keys, values
+# The parallel group kernel keeps one row of accumulators per thread, so it is only used with a modest number
+# of groups.
+_PARALLEL_MAX_GROUPS = 10_000
+
+
+def _get_numba_kernels():
+    """"Imports Numba and builds its kernels on first use, returning None when Numba is not installed"""
+    global _numba_kernels
+    if _numba_kernels is None:
+        try:
+            import numba
+        except ImportError:
+            _numba_kernels = {}
+        else:
+            _numba_kernels = _build_numba_kernels(numba)
+    return _numba_kernels or None
+
+
+def _build_numba_kernels(numba):
+    """"Compiles the Numba kernels, returning them in a dict keyed by name"""
+
+    @numba.njit(cache=True)
+    def group_sum_count(codes, values, n_groups):
+        # Sums and counts of each group, accumulated together in a single pass over the codes.
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, np.int64)
+        for i in range(codes.size):
+            c = codes[i]
+            sums[c] += values[i]
+            counts[c] += 1
+        return sums, counts
+
+    @numba.njit(cache=True, parallel=True)
+    def group_sum_count_parallel(codes, values, n_groups, n_chunks):
+        # Same as group_sum_count, splitting the codes in chunks with private accumulators.
+        local_sums = np.zeros((n_chunks, n_groups))
+        local_counts = np.zeros((n_chunks, n_groups), np.int64)
+        chunk_size = (codes.size + n_chunks - 1) // n_chunks
+        for t in numba.prange(n_chunks):
+            # Each chunk only writes to its own row, so threads never contend on the same accumulator.
+            for i in range(t * chunk_size, min((t + 1) * chunk_size, codes.size)):
+                c = codes[i]
+                local_sums[t, c] += values[i]
+                local_counts[t, c] += 1
+        return local_sums.sum(axis=0), local_counts.sum(axis=0)
+
+    return {
+        "group_sum_count": group_sum_count,
+        "group_sum_count_parallel": group_sum_count_parallel,
+        "get_num_threads": numba.get_num_threads,
+    }
+
+
+def _numba_supports(arr):
+    """"Checks whether Numba can compile kernels for the dtype of an array (integers, float32 and float64)"""
+    return arr.dtype.isnative and (arr.dtype.kind in "iu" or arr.dtype in (np.float32, np.float64))
+
+
+def groupby(keys, values, agg, use_numba: bool = False):
+    """"Aggregates values grouped by the unique keys
+
+    Common aggregators are computed without calling agg once per group: np.mean and np.sum factorize the keys
+    into integer codes and accumulate them with np.bincount, while np.max, np.min and np.std use a single stable
+    sort followed by ufunc.reduceat over the contiguous groups. These specializations are registered in
+    _AGG_FASTPATHS. Any other callable is called once per group, on slices of the sorted values.
+
+    With use_numba=True, np.mean is computed by a Numba kernel that accumulates sums and counts in a single pass.
+    Importing and compiling it costs up to a second on the first call of each process, so it only pays off when
+    groupby is called repeatedly on large arrays.
+
+    Parameters
+    ----------
+    keys: Numpy array containing the group of each element
+    values: Numpy array containing the values to be aggregated, with the same shape as keys. Both arrays are
+        flattened before grouping.
+    agg: Aggregation function, called with the values of each group
+    use_numba: Whether to use the Numba kernels when Numba is installed. Default: False
+
+    Returns
+    ----------
+    keys, values
+    keys: Numpy array with the unique keys, sorted
+    values: Numpy array with the aggregated value of each key
+    """
+    keys = np.asarray(keys)
+    values = np.asarray(values)
+    assert keys.shape == values.shape, "keys and values must have the same shape"
+    keys = keys.ravel()
+    values = values.ravel()
+    fastpath = _NUMBA_AGG_FASTPATHS.get(agg) if use_numba else None
+    if fastpath is None:
+        fastpath = _AGG_FASTPATHS.get(agg)
+    if fastpath is not None:
+        return fastpath(keys, values)
+    return _generic_groupby(keys, values, agg)
+
+
+def _factorize(keys):
+    """"Maps keys to integer codes, returning the codes and the key of each code
+
+    Integer keys spanning a range no larger than the array (such as categorical codes) are offset by their
+    minimum and used as codes directly, without sorting or hashing. Some codes may then have no elements, so
+    callers drop the empty ones using the group counts.
+    """
+    if keys.dtype.kind in "iu" and len(keys) > 0:
+        low, high = keys.min(), keys.max()
+        if int(high) - int(low) < len(keys):
+            codes = keys.astype(np.intp).ravel() - np.intp(low)
+            return codes, low + np.arange(int(high) - int(low) + 1, dtype=keys.dtype)
+    uniques, codes = np.unique(keys, return_inverse=True)
+    return codes.ravel(), uniques
+
+
+def _group_means(uniques, sums, counts, dtype):
+    present = counts > 0
+    means = sums[present] / counts[present]
+    # As in np.mean, float values keep their dtype and any other values give float64.
+    if dtype.kind == "f":
+        means = means.astype(dtype.newbyteorder("="), copy=False)
+    return uniques[present], means
+
+
+def _mean_bincount(keys, values):
+    if not np.can_cast(values.dtype, np.float64):
+        # bincount only takes weights it can safely cast to float64 (no objects, complex or longdouble).
+        return _generic_groupby(keys, values, np.mean)
+    codes, uniques = _factorize(keys)
+    sums = np.bincount(codes, weights=values, minlength=len(uniques))
+    counts = np.bincount(codes, minlength=len(uniques))
+    return _group_means(uniques, sums, counts, values.dtype)
+
+
+def _mean_numba(keys, values):
+    kernels = _get_numba_kernels()
+    if kernels is None or not _numba_supports(values):
+        return _mean_bincount(keys, values)
+    codes, uniques = _factorize(keys)
+    n_groups = len(uniques)
+    n_threads = kernels["get_num_threads"]()
+    if n_threads > 1 and n_groups <= _PARALLEL_MAX_GROUPS:
+        sums, counts = kernels["group_sum_count_parallel"](codes, values, n_groups, n_threads)
+    else:
+        sums, counts = kernels["group_sum_count"](codes, values, n_groups)
+    return _group_means(uniques, sums, counts, values.dtype)
+
+
+def _sum_bincount(keys, values):
+    if values.dtype.kind != "f" or not np.can_cast(values.dtype, np.float64):
+        # bincount accumulates weights as float64, reduceat keeps integer and longdouble sums exact.
+        return _ufunc_reduceat(keys, values, np.add)
+    codes, uniques = _factorize(keys)
+    sums = np.bincount(codes, weights=values, minlength=len(uniques))
+    present = np.bincount(codes, minlength=len(uniques)) > 0
+    return uniques[present], sums[present].astype(values.dtype, copy=False)
+
+
+def _sort_groups(keys, values):
+    """"Sorts keys and values by key, returning the start index of each group in the sorted arrays"""
+    order = np.argsort(keys, kind="stable")
+    keys_sorted = keys[order]
+    values_sorted = values[order]
+    previous, current = keys_sorted[:-1], keys_sorted[1:]
+    boundaries = current != previous
+    if keys_sorted.dtype.kind in "fc":
+        # NaN keys are sorted to the end and, as in np.unique, all of them form a single group.
+        boundaries &= ~(np.isnan(current) & np.isnan(previous))
+    starts = np.flatnonzero(np.r_[len(keys_sorted) > 0, boundaries])
+    return keys_sorted, values_sorted, starts
+
+
+def _group_counts(starts, n):
+    return np.diff(np.r_[starts, n])
+
+
+def _ufunc_reduceat(keys, values, ufunc):
+    keys_sorted, values_sorted, starts = _sort_groups(keys, values)
+    if len(starts) == 0:
+        return keys_sorted, values_sorted
+    return keys_sorted[starts], ufunc.reduceat(values_sorted, starts)
+
+
+def _max_reduceat(keys, values):
+    return _ufunc_reduceat(keys, values, np.maximum)
+
+
+def _min_reduceat(keys, values):
+    return _ufunc_reduceat(keys, values, np.minimum)
+
+
+def _generic_groupby(keys, values, agg):
+    keys_sorted, values_sorted, starts = _sort_groups(keys, values)
+    ends = np.r_[starts[1:], len(keys_sorted)]
+    # Each group is a contiguous slice (a view) of the sorted values, so no per-group mask or copy is needed.
+    aggregated = [agg(values_sorted[start:end]) for start, end in zip(starts, ends)]
+    return keys_sorted[starts], np.array(aggregated)
+
+
+def _std_reduceat(keys, values):
+    if not np.can_cast(values.dtype, np.float64):
+        return _generic_groupby(keys, values, np.std)
+    # As in np.std, float values keep their dtype and any other values give float64.
+    dtype = values.dtype if values.dtype.kind == "f" else np.dtype(np.float64)
+    keys_sorted, values_sorted, starts = _sort_groups(keys, values)
+    if len(starts) == 0:
+        return keys_sorted, values_sorted.astype(dtype)
+    counts = _group_counts(starts, len(keys_sorted))
+    means = np.add.reduceat(values_sorted, starts, dtype=np.float64) / counts
+    # Two-pass variance: squared deviations from each group mean, broadcast back to the elements.
+    deviations = values_sorted - np.repeat(means, counts)
+    stds = np.sqrt(np.add.reduceat(deviations * deviations, starts) / counts)
+    return keys_sorted[starts], stds.astype(dtype, copy=False)
+
+
+_AGG_FASTPATHS = {
+    np.mean: _mean_bincount,
+    np.sum: _sum_bincount,
+    np.max: _max_reduceat,
+    np.min: _min_reduceat,
+    np.std: _std_reduceat,
+}
+
+_NUMBA_AGG_FASTPATHS = {
+    np.mean: _mean_numba,
+}
+
+
+def unique_count_at_least(arr, threshold):
+    """"Checks whether an array has at least threshold unique values
+
+    The unique values are counted on prefixes of the array that double in size, stopping as soon as the threshold
+    is reached. Arrays with many unique values are then decided from a small prefix, instead of sorting the whole
+    array. NaN values are counted as a single unique value, as in np.unique.
+
+    Parameters
+    ----------
+    arr: Numpy array containing the data
+    threshold: Number of unique values to look for
+
+    Returns
+    ----------
+    at_least: True if arr has threshold or more unique values
+    """
+    arr = np.asarray(arr).ravel()
+    # A prefix needs at least threshold elements to hold threshold unique values.
+    size = max(threshold, 1)
+    while True:
+        if len(np.unique(arr[:size])) >= threshold:
+            return True
+        if size >= arr.size:
+            return False
+        size *= 2
@@ -11,27 +11,34 @@ following methods:
 # Author: Henrique Magalhães Soares
 # Licence: MIT
 
+from __future__ import annotations
+
 import numpy as np
-import matplotlib.pyplot as plt
 
-from matplotlib import gridspec
-from matplotlib.axes import Axes
-from typing import List, AnyStr, Tuple, Union
+from collections import Counter
+from typing import List, AnyStr, Tuple, Union, TYPE_CHECKING
 from .levels import infer_measurement_level
 from .chart_helpers import label_bar, label_barh, make_percentage_labels
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.axes import Axes
+
 
-def _missing_distribution(arr: np.array, ax: Axes, **kwargs):
+def _missing_distribution(arr: np.array, ax: Axes, nan_mask: np.array = None, **kwargs):
     """"Create a plot for missing values distribution in an numpy array
 
     Parameters
     ----------
     arr: Array containing the data
     ax: Matplotlib Axes object where we will draw the chart.
+    nan_mask: Boolean array marking the NaN values of arr. Default: None (Computed from arr)
     **kwargs: Other named parameters that will be forwarded to _make_percentage_labels and matplotlib plot methods.
     """
     n = len(arr)
-    n_miss = np.isnan(arr).sum()
+    if nan_mask is None:
+        nan_mask = np.isnan(arr)
+    n_miss = np.count_nonzero(nan_mask)
     n_fill = n - n_miss
 
     headers = ["Filled", "Missing"]
@@ -42,31 +49,48 @@ def _missing_distribution(arr: np.array, ax: Axes, **kwargs):
     label_barh(ax, labels)
 
 
-def _filled_distribution(arr: np.array, ax: Axes, **kwargs):
+def _filled_distribution(arr: np.array, ax: Axes, nan_mask: np.array = None, bins=None, **kwargs):
     """"Create a plot of the distribution of filled values in a numpy array
 
     Parameters
     ----------
     arr: Array containing the data
     ax: Matplotlib Axes object where we will draw the chart.
+    nan_mask: Boolean array marking the NaN values of arr. Default: None (Computed from arr)
+    bins: Bins of the histogram, as accepted by np.histogram. Default: None (Uses matplotlib's hist.bins setting)
     **kwargs: Other named parameters that will be forwarded to _make_percentage_labels and matplotlib plot methods.
     """
-    arr_notna = arr[~np.isnan(arr)]
-    values, _, bars = ax.hist(arr_notna, edgecolor="white", **kwargs)
-    labels = make_percentage_labels(values, **kwargs)
+    # matplotlib is imported here so that importing this module does not pay its start up cost.
+    from matplotlib import rcParams
+
+    if nan_mask is None:
+        nan_mask = np.isnan(arr)
+    arr_notna = arr[~nan_mask]
+    if bins is None:
+        bins = rcParams["hist.bins"]
+    counts, edges = np.histogram(arr_notna, bins=bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", edgecolor="white", **kwargs)
+    labels = make_percentage_labels(counts, **kwargs)
     label_bar(ax, labels)
 
 
-def interval_distribution(arr: np.array, **kwargs) -> Tuple[plt.Figure, Tuple[Axes, Axes]]:
+def interval_distribution(arr: np.array, axes: Tuple[Axes, Axes] = None, bins=None, **kwargs) -> \
+        Tuple[plt.Figure, Tuple[Axes, Axes]]:
     """"Plot a distribution analysis for interval scaled features
 
     This function performs and plot the distribution analysis over a numpy array. This analysis consists in
     a missing values distribution (Plotting the percentage of NaN values versus valid values) as well as a
     histogram over the valid values.
 
+    When plotting many features in a loop, pass the axes returned by a previous call to draw on the same figure.
+    The axes are cleared and reused, instead of building a new figure and layout for every feature.
+
     Parameters
     ----------
         arr: Numpy array, the array containing the data.
+        axes: Tuple (ax_fill, ax_dist) of Axes to be cleared and reused. Default: None (Creates a new figure)
+        bins: Bins of the filled values histogram, as accepted by np.histogram. Default: None (Uses matplotlib's
+            hist.bins setting)
         **kwargs: Keyword arguments that will be forwarded to the underlying matplotlib functions.
 
     Returns
@@ -76,21 +100,37 @@ def interval_distribution(arr: np.array, **kwargs) -> Tuple[plt.Figure, Tuple[Ax
         ax_fill: Matplotlib Axes object for the missing values distribution plot
         ax_dist: Matplotlib Axes object for the filled values distribution plot
     """
-    fig = plt.figure()
-    gs = gridspec.GridSpec(2, 1, figure=fig, height_ratios=(1, 2))
-    ax_fill, ax_dist = (plt.subplot(gs_i) for gs_i in gs)
-
-    _missing_distribution(arr, ax_fill, **kwargs)
-    _filled_distribution(arr, ax_dist, **kwargs)
+    if axes is None:
+        # matplotlib is imported here so that importing this module does not pay its start up cost.
+        import matplotlib.pyplot as plt
+        from matplotlib import gridspec
+
+        fig = plt.figure()
+        gs = gridspec.GridSpec(2, 1, figure=fig, height_ratios=(1, 2))
+        ax_fill, ax_dist = (plt.subplot(gs_i) for gs_i in gs)
+    else:
+        ax_fill, ax_dist = axes
+        ax_fill.clear()
+        ax_dist.clear()
+        fig = ax_fill.figure
+
+    # Both plots need the NaN mask, so we compute it only once.
+    nan_mask = np.isnan(arr)
+    _missing_distribution(arr, ax_fill, nan_mask=nan_mask, **kwargs)
+    _filled_distribution(arr, ax_dist, nan_mask=nan_mask, bins=bins, **kwargs)
     return fig, (ax_fill, ax_dist)
 
 
-def nominal_distribution(arr: np.array, **kwargs) -> Tuple[plt.Figure, Tuple[Axes]]:
+def nominal_distribution(arr: np.array, ax: Axes = None, **kwargs) -> Tuple[plt.Figure, Tuple[Axes]]:
     """"Plot a distribution analysis for nominal scaled features
 
+    When plotting many features in a loop, pass the ax returned by a previous call to draw on the same figure.
+    The axes are cleared and reused, instead of building a new figure and layout for every feature.
+
     Parameters
     ----------
         arr: Numpy array, the array containing the data.
+        ax: Matplotlib Axes object to be cleared and reused. Default: None (Creates a new figure)
         **kwargs: Keyword arguments that will be forwarded to the underlying matplotlib functions.
 
     Returns
@@ -100,12 +140,29 @@ def nominal_distribution(arr: np.array, **kwargs) -> Tuple[plt.Figure, Tuple[Axe
         ax_fill: Matplotlib Axes object for the missing values distribution plot
         ax_dist: Matplotlib Axes object for the filled values distribution plot
     """
-    fig = plt.figure()
-    gs = gridspec.GridSpec(1, 1, figure=fig)
-    ax = plt.subplot(gs[0])
-
-    values, counts = np.unique(arr, return_counts=True)
-    values = [str(v) for v in values]
+    if ax is None:
+        # matplotlib is imported here so that importing this module does not pay its start up cost.
+        import matplotlib.pyplot as plt
+        from matplotlib import gridspec
+
+        fig = plt.figure()
+        gs = gridspec.GridSpec(1, 1, figure=fig)
+        ax = plt.subplot(gs[0])
+    else:
+        ax.clear()
+        fig = ax.figure
+
+    if arr.dtype.kind == "O":
+        # np.unique sorts object arrays with Python level comparisons, so we count them by hashing instead and
+        # only sort the unique values.
+        counter = Counter(arr)
+        values = np.fromiter(counter.keys(), dtype=object, count=len(counter))
+        counts = np.fromiter(counter.values(), dtype=np.int64, count=len(counter))
+        order = np.argsort(values)
+        values, counts = values[order], counts[order]
+    else:
+        values, counts = np.unique(arr, return_counts=True)
+    values = values if values.dtype.kind == "U" else values.astype(str)
     ax.barh(values, counts)
 
     labels = make_percentage_labels(counts, **kwargs)
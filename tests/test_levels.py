@@ -13,6 +13,15 @@ def test__infer_measurement_by_count():
     assert _infer_measurement_by_count(arr,  threshold=6) == "interval"
 
 
+def test__infer_measurement_by_count_random_sample():
+    arr = np.array(1000*[1] + list(np.random.rand(1000)))
+    assert _infer_measurement_by_count(arr, use_first=100) == "nominal"
+    assert _infer_measurement_by_count(arr, use_first=100, sample="random", seed=0) == "interval"
+    assert _infer_measurement_by_count(arr, use_first=5000, sample="random") == "interval"
+    with pytest.raises(AssertionError):
+        _infer_measurement_by_count(arr, use_first=100, sample="last")
+
+
 def test_infer_measurement_level():
     arr = np.random.rand(100)
     assert infer_measurement_level(arr) == "interval"
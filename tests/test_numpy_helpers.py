@@ -0,0 +1,223 @@
+import pytest
+import numpy as np
+import lobsang.numpy_helpers
+from lobsang.numpy_helpers import groupby, unique_count_at_least, _get_numba_kernels
+
+
+def _reference_groupby(keys, values, agg):
+    unique_keys = np.unique(keys)
+    return unique_keys, np.array([agg(values[keys == key]) for key in unique_keys])
+
+
+@pytest.mark.parametrize("agg", [np.mean, np.sum, np.max, np.min, np.std, np.median])
+def test_groupby(agg):
+    keys = np.random.randint(0, 7, 500)
+    values = np.random.rand(500)
+    expected_keys, expected_values = _reference_groupby(keys, values, agg)
+    result_keys, result_values = groupby(keys, values, agg)
+    np.testing.assert_array_equal(result_keys, expected_keys)
+    np.testing.assert_allclose(result_values, expected_values)
+
+
+def test_groupby_string_keys():
+    keys = np.array(["b", "a", "c", "a", "b", "a"])
+    values = np.array([1, 2, 3, 4, 5, 6])
+    result_keys, result_values = groupby(keys, values, np.mean)
+    np.testing.assert_array_equal(result_keys, ["a", "b", "c"])
+    np.testing.assert_allclose(result_values, [4, 3, 3])
+    result_keys, result_values = groupby(keys, values, np.sum)
+    np.testing.assert_array_equal(result_values, [12, 6, 3])
+
+
+@pytest.mark.parametrize("keys", [
+    np.array([3, 1, 3, 7, 1, 3]),
+    np.array([-2, 5, -2, 0, 5, 5], dtype=np.int8),
+    np.array([10**9, 1, 10**9, 5, 1, 1]),
+])
+@pytest.mark.parametrize("agg", [np.mean, np.sum])
+def test_groupby_integer_keys(keys, agg):
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    expected_keys, expected_values = _reference_groupby(keys, values, agg)
+    result_keys, result_values = groupby(keys, values, agg)
+    np.testing.assert_array_equal(result_keys, expected_keys)
+    assert result_keys.dtype == keys.dtype
+    np.testing.assert_allclose(result_values, expected_values)
+
+
+@pytest.mark.parametrize("agg", [np.mean, np.sum])
+def test_groupby_float32_values(agg):
+    keys = np.random.randint(0, 7, 500)
+    values = np.random.rand(500).astype(np.float32)
+    expected_keys, expected_values = _reference_groupby(keys, values, agg)
+    result_keys, result_values = groupby(keys, values, agg)
+    np.testing.assert_array_equal(result_keys, expected_keys)
+    assert result_values.dtype == np.float32
+    np.testing.assert_allclose(result_values, expected_values, rtol=1e-5)
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.float16, np.float32, np.float64, np.dtype(">f8")])
+def test_groupby_mean_kernel_dtypes(dtype):
+    keys = np.random.randint(0, 7, 500)
+    values = (100 * np.random.rand(500)).astype(dtype)
+    expected_keys, expected_values = _reference_groupby(keys, values, np.mean)
+    result_keys, result_values = groupby(keys, values, np.mean, use_numba=True)
+    np.testing.assert_array_equal(result_keys, expected_keys)
+    assert result_values.dtype == np.mean(values).dtype
+    np.testing.assert_allclose(result_values, expected_values, rtol=1e-3)
+
+
+def test_groupby_use_numba_not_installed(monkeypatch):
+    monkeypatch.setattr(lobsang.numpy_helpers, "_numba_kernels", {})
+    keys = np.array([1, 2, 1, 2, 1])
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    result_keys, result_values = groupby(keys, values, np.mean, use_numba=True)
+    np.testing.assert_array_equal(result_keys, [1, 2])
+    np.testing.assert_allclose(result_values, [3.0, 3.0])
+
+
+@pytest.mark.parametrize("dtype", [object, np.longdouble, np.complex128])
+@pytest.mark.parametrize("agg", [np.mean, np.sum])
+def test_groupby_values_not_castable_to_float64(dtype, agg):
+    keys = np.array([1, 2, 1, 2, 1])
+    values = np.array([1, 2, 3, 4, 6], dtype=dtype)
+    result_keys, result_values = groupby(keys, values, agg)
+    np.testing.assert_array_equal(result_keys, [1, 2])
+    np.testing.assert_allclose(result_values.astype(np.complex128), [agg([1, 3, 6]), agg([2, 4])])
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.float32, np.float64, np.complex128])
+def test_groupby_generic_dtype(dtype):
+    keys = np.array([1, 2, 1, 2, 1])
+    values = np.array([1, 2, 3, 4, 6], dtype=dtype)
+    for agg in [np.median, np.var, len]:
+        _, result_values = groupby(keys, values, agg)
+        expected_values = np.array([agg(values[[0, 2, 4]]), agg(values[[1, 3]])])
+        assert result_values.dtype == expected_values.dtype
+        np.testing.assert_allclose(result_values, expected_values)
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.float16, np.float32, np.float64, np.longdouble, np.complex128])
+def test_groupby_mean_dtype(dtype):
+    keys = np.array([1, 2, 1, 2, 1])
+    values = np.array([1, 2, 3, 4, 6], dtype=dtype)
+    _, result_values = groupby(keys, values, np.mean)
+    assert result_values.dtype == np.mean(values).dtype
+    np.testing.assert_allclose(result_values, [np.mean(values[[0, 2, 4]]), np.mean(values[[1, 3]])], rtol=1e-3)
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.float16, np.float32, np.float64, np.longdouble, np.complex128])
+def test_groupby_std_dtype(dtype):
+    keys = np.array([1, 2, 1, 2, 1])
+    values = np.array([1, 2, 3, 4, 6], dtype=dtype)
+    _, result_values = groupby(keys, values, np.std)
+    assert result_values.dtype == np.std(values).dtype
+    np.testing.assert_allclose(result_values, [np.std(values[[0, 2, 4]]), np.std(values[[1, 3]])], rtol=1e-3)
+
+
+def test_groupby_generic_mixed_result_dtypes():
+    keys = np.array([1, 2])
+    values = np.array([4.0, -4.0])
+    _, result_values = groupby(keys, values, lambda x: np.emath.sqrt(x[0]))
+    np.testing.assert_array_equal(result_values, [2.0, 2.0j])
+    _, result_values = groupby(keys, values, lambda x: np.float32(x[0]) if x[0] > 0 else np.float64(1e-40))
+    assert result_values.dtype == np.float64
+    np.testing.assert_array_equal(result_values, [4.0, 1e-40])
+
+
+def test_groupby_generic_multiple_values():
+    keys = np.array([1, 2, 1, 2, 1])
+    values = np.array([1.0, 2.0, 3.0, 4.0, 6.0])
+    result_keys, result_values = groupby(keys, values, lambda x: (x.min(), x.max()))
+    np.testing.assert_array_equal(result_keys, [1, 2])
+    np.testing.assert_array_equal(result_values, [[1.0, 6.0], [2.0, 4.0]])
+    _, result_values = groupby(keys, values, lambda x: np.percentile(x, [0, 100]))
+    np.testing.assert_array_equal(result_values, [[1.0, 6.0], [2.0, 4.0]])
+
+
+def test_groupby_generic_non_numeric_values():
+    keys = np.array([1, 2, 1])
+    values = np.array(["b", "c", "a"])
+    result_keys, result_values = groupby(keys, values, min)
+    np.testing.assert_array_equal(result_keys, [1, 2])
+    np.testing.assert_array_equal(result_values, ["a", "c"])
+
+
+@pytest.mark.parametrize("n_chunks", [1, 3, 8])
+def test_group_sum_count_parallel_kernel(n_chunks):
+    pytest.importorskip("numba")
+    kernels = _get_numba_kernels()
+    codes = np.random.randint(0, 5, 101)
+    values = np.random.rand(101)
+    expected_sums, expected_counts = kernels["group_sum_count"](codes, values, 5)
+    sums, counts = kernels["group_sum_count_parallel"](codes, values, 5, n_chunks)
+    np.testing.assert_allclose(sums, expected_sums)
+    np.testing.assert_array_equal(counts, expected_counts)
+
+
+@pytest.mark.parametrize("agg", [np.mean, np.sum, np.max, np.std, np.median])
+def test_groupby_2d_input(agg):
+    keys = np.array([[1, 2], [1, 2]])
+    values = np.array([[1.0, 2.0], [3.0, 4.0]])
+    expected_keys, expected_values = _reference_groupby(keys.ravel(), values.ravel(), agg)
+    result_keys, result_values = groupby(keys, values, agg)
+    np.testing.assert_array_equal(result_keys, expected_keys)
+    np.testing.assert_allclose(result_values, expected_values)
+
+
+@pytest.mark.parametrize("agg", [np.mean, np.sum, np.max, np.median])
+def test_groupby_shape_mismatch(agg):
+    keys = np.array([1, 2, 1, 2, 1, 2])
+    values = np.array([1.0, 2.0, 3.0])
+    with pytest.raises(AssertionError):
+        groupby(keys, values, agg)
+
+
+@pytest.mark.parametrize("agg", [np.mean, np.sum, np.max, np.min, np.std, np.median])
+def test_groupby_nan_keys(agg):
+    keys = np.array([1.0, np.nan, 2.0, np.nan, 1.0, np.nan])
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 9.0])
+    result_keys, result_values = groupby(keys, values, agg)
+    np.testing.assert_array_equal(result_keys, np.unique(keys))
+    np.testing.assert_allclose(result_values, [agg([1.0, 5.0]), agg([3.0]), agg([2.0, 4.0, 9.0])])
+
+
+def test_groupby_empty():
+    result_keys, result_values = groupby(np.array([]), np.array([]), np.mean)
+    assert len(result_keys) == 0
+    assert len(result_values) == 0
+
+
+def test_unique_count_at_least():
+    arr = np.array(10*[1] + 20*[2] + 30*[5])
+    assert unique_count_at_least(arr, 3)
+    assert not unique_count_at_least(arr, 4)
+    arr = np.array([np.nan, 1.0, np.nan, 2.0])
+    assert unique_count_at_least(arr, 3)
+    assert not unique_count_at_least(arr, 4)
+    arr = np.array(["a", "b", "a"])
+    assert unique_count_at_least(arr, 2)
+    assert not unique_count_at_least(arr, 3)
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.float16, np.float32, np.float64, np.longdouble, np.dtype(">f8")])
+def test_unique_count_at_least_dtypes(dtype):
+    missing = np.nan if np.dtype(dtype).kind == "f" else 0
+    arr = np.array([1, 2, 2, missing, 3, missing], dtype=dtype)
+    assert unique_count_at_least(arr, 4)
+    assert not unique_count_at_least(arr, 5)
+
+
+def test_unique_count_at_least_prefixes():
+    arr = np.array(1000*[1] + [2, 3])
+    assert unique_count_at_least(arr, 3)
+    assert not unique_count_at_least(arr, 4)
+    arr = np.random.rand(10**5)
+    assert unique_count_at_least(arr, 10)
+    assert unique_count_at_least(arr, 10**5)
+    assert not unique_count_at_least(arr, 10**5 + 1)
+    assert unique_count_at_least(np.array([]), 0)
+    assert not unique_count_at_least(np.array([]), 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,14 +1,16 @@
 import pytest
-from lobsang.univariate import _label_barh, _label_bar, _make_percentage_labels
+import numpy as np
+from lobsang.chart_helpers import label_barh, label_bar, make_percentage_labels
+from lobsang.univariate import interval_distribution, nominal_distribution
 import matplotlib.pyplot as plt
 
 
 def test__make_percentage_labels():
     values = [2, 2, 4]
-    assert _make_percentage_labels(values) == ["25.0%", "25.0%", "50.0%"]
-    assert _make_percentage_labels(values, decimals=2) == ["25.00%", "25.00%", "50.00%"]
+    assert make_percentage_labels(values) == ["25.0%", "25.0%", "50.0%"]
+    assert make_percentage_labels(values, decimals=2) == ["25.00%", "25.00%", "50.00%"]
     with pytest.raises(TypeError):
-        _make_percentage_labels(["a", "b", "c"])
+        make_percentage_labels(["a", "b", "c"])
 
 
 @pytest.fixture()
@@ -31,12 +33,45 @@ def barh_labels_2():
 
 
 def test__label_barh_1(barh_ax, barh_labels_1):
-    _label_barh(barh_ax, barh_labels_1)
+    label_barh(barh_ax, barh_labels_1)
 
 
 def test__label_barh_2(barh_ax, barh_labels_2):
     with pytest.raises(AssertionError):
-        _label_barh(barh_ax, barh_labels_2)
+        label_barh(barh_ax, barh_labels_2)
+
+
+def test__label_bar():
+    _, ax = plt.subplots(1, 1)
+    ax.bar(["a", "b", "c"], [1, 2, 3])
+    y_min, y_max = ax.get_ylim()
+    label_bar(ax, ["16.7%", "33.3%", "50.0%"])
+    assert [text.get_text() for text in ax.texts] == ["16.7%", "33.3%", "50.0%"]
+    assert ax.get_ylim() == pytest.approx((y_min, 1.03*y_max))
+
+
+def test_interval_distribution_reuse_axes():
+    arr = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+    fig, axes = interval_distribution(arr)
+    fig_reused, axes_reused = interval_distribution(2 * arr, axes=axes)
+    assert fig_reused is fig
+    assert axes_reused == axes
+    assert len(fig.axes) == 2
+
+
+def test_interval_distribution_bins():
+    arr = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+    _, (ax_fill, ax_dist) = interval_distribution(arr, bins=3)
+    assert len(ax_fill.patches) == 2
+    assert len(ax_dist.patches) == 3
+
+
+@pytest.mark.parametrize("dtype", [str, object])
+def test_nominal_distribution(dtype):
+    arr = np.array(["b", "a", "b", "c", "b", "a"], dtype=dtype)
+    _, ax = nominal_distribution(arr)
+    assert [label.get_text() for label in ax.get_yticklabels()] == ["a", "b", "c"]
+    assert [bar.get_width() for bar in ax.patches] == [2, 3, 1]
 
 
 if __name__ == "__main__":